@@ -3,29 +3,151 @@ Notion Database Auto-Population Script
 GitHub-safe version with environment variable configuration
 “””
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple
 import os
+import sqlite3
 from dotenv import load_dotenv
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 import sys
 
 # Load environment variables
 
 load_dotenv()
 
-# Set up logging
+# Set up logging; per-row messages are DEBUG, and records are handed to a
+# background thread so formatting and stream I/O stay off the sync path
 
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+))
+_log_listener = QueueListener(_log_queue, _log_handler)
+
+# Unknown LOG_LEVEL names fall back to INFO instead of failing at import
+_log_level_name = os.getenv("LOG_LEVEL", "INFO").upper()
+_log_level = logging.getLevelName(_log_level_name)
+_log_level_invalid = not isinstance(_log_level, int)
+if _log_level_invalid:
+    _log_level = logging.INFO
+
+# The queue side only merges message args; the listener adds timestamps etc.
 logging.basicConfig(
-level=logging.INFO,
-format=’%(asctime)s - %(name)s - %(levelname)s - %(message)s’
+level=_log_level,
+format="%(message)s",
+handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def _flush_logs():
+    """Write out queued log records before printing directly to the terminal"""
+    _log_listener.stop()
+    _log_listener.start()
 logger = logging.getLogger(**name**)
+if _log_level_invalid:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", _log_level_name)
+
+# Default query used by the SQL connectors when DB_QUERY is not set
+DEFAULT_QUERY = """
+    SELECT 
+        uid, name, status, reviewer_name, 
+        review_date, next_follow_up, date_added, 
+        platform, socials
+    FROM {table}
+    WHERE sync_status IS NULL OR sync_status != 'synced'
+"""
+
+@functools.lru_cache(maxsize=None)
+def _get_db_config() -> Dict[str, Optional[str]]:
+    """Read the database settings from the environment once per process"""
+    table = os.getenv("DB_TABLE", "fud_outreach_tracker")
+    return {
+        "host": os.getenv("DB_HOST"),
+        "port": os.getenv("DB_PORT"),
+        "name": os.getenv("DB_NAME"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "table": table,
+        "query": os.getenv("DB_QUERY") or DEFAULT_QUERY.format(table=table),
+        # A custom DB_QUERY may read from anywhere, so only write sync_status
+        # back when the table it should go to is known
+        "mark_synced": bool(os.getenv("DB_TABLE") or not os.getenv("DB_QUERY")),
+        "mongo_connection_string": os.getenv("MONGO_CONNECTION_STRING"),
+        "collection": os.getenv("DB_COLLECTION", "fud_outreach_tracker"),
+        "sqlite_path": os.getenv("SQLITE_DB_PATH", "database.db")
+    }
+
+def _as_str(value) -> str:
+    """Return value as a string, skipping the str() call for strings"""
+    return value if isinstance(value, str) else str(value)
+
+def _batched(iterable: Iterable, size: int) -> Iterator[List]:
+    """Yield successive lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
 
 class NotionDatabaseSync:
-def **init**(self, notion_token: str = None, database_id: str = None):
+
+```
+# Map your data fields to Notion properties: (notion_prop, data_key, prop_type)
+_PROPERTY_MAPPING: ClassVar[Tuple[Tuple[str, str, str], ...]] = (
+    ("Name", "name", "title"),
+    ("UID", "uid", "rich_text"),
+    ("Status", "status", "select"),
+    ("Reviewer Name", "reviewer_name", "rich_text"),
+    ("Review Date", "review_date", "date"),
+    ("Next Follow Up", "next_follow_up", "date"),
+    ("Date Added", "date_added", "date"),
+    ("Platform", "platform", "select"),
+    ("Socials", "socials", "rich_text")
+)
+
+# Only update specific fields that might change
+_UPDATE_FIELDS: ClassVar[Tuple[str, ...]] = (
+    "status", "platform", "socials", "reviewer_name",
+    "review_date", "next_follow_up"
+)
+
+# Retry policy shared by the requests and aiohttp code paths
+_MAX_RETRIES: ClassVar[int] = 8
+_RETRY_STATUSES: ClassVar[Tuple[int, ...]] = (429, 500, 502, 503, 504)
+# Page creation is not idempotent: a 5xx or read error may still have created
+# the page, so creates only retry when Notion definitely did not process them
+_CREATE_RETRY_STATUSES: ClassVar[Tuple[int, ...]] = (429,)
+
+# Records are pulled from the source lazily and resolved against Notion in batches
+_LOOKUP_BATCH_SIZE: ClassVar[int] = 100
+
+_FORMATTERS: ClassVar[Dict[str, Callable[[object], Dict]]] = {
+    "title": lambda value: {"title": [{"text": {"content": _as_str(value)}}]},
+    "rich_text": lambda value: {"rich_text": [{"text": {"content": _as_str(value)}}]},
+    "select": lambda value: {"select": {"name": _as_str(value)}},
+    # date/datetime values from DB drivers become ISO 8601, as Notion expects
+    "date": lambda value: {"date": {"start": value.isoformat() if hasattr(value, "isoformat") else _as_str(value)}}
+}
+```
+
+def **init**(self, notion_token: str = None, database_id: str = None, state_path: str = None,
+use_snapshot: bool = None):
 “””
 Initialize the Notion sync client
 
@@ -33,6 +155,10 @@ Initialize the Notion sync client
     Args:
         notion_token: Your Notion Integration Token (defaults to env var)
         database_id: The ID of your Notion database (defaults to env var)
+        state_path: Path of the local sync state file (defaults to env var)
+        use_snapshot: Resolve UIDs from one full snapshot of the Notion database
+            instead of filtered lookups (defaults to env var, off). Worth it only
+            when the records to sync are comparable in number to the database
     """
     self.notion_token = notion_token or os.getenv("NOTION_TOKEN")
     self.database_id = database_id or os.getenv("NOTION_DATABASE_ID")
@@ -49,6 +175,69 @@ Initialize the Notion sync client
         "Notion-Version": "2022-06-28"
     }
     self.base_url = "https://api.notion.com/v1"
+    
+    # Content hashes of records already pushed, used to skip unchanged rows
+    self.sync_state = SyncStateStore(
+        state_path or os.getenv("SYNC_STATE_PATH", ".notion_sync_state.db"),
+        self.database_id
+    )
+    
+    # Parent reference is identical for every created page, build it once
+    self._parent = {"database_id": self.database_id}
+    
+    # UID -> page ID (or None when absent) lookups made during this run
+    self._uid_cache: Dict[str, Optional[str]] = {}
+    # Set once snapshot_index() has loaded every UID in the database
+    self._index_complete = False
+    if use_snapshot is None:
+        use_snapshot = os.getenv("NOTION_SNAPSHOT_INDEX", "false").lower() in ("1", "true", "yes")
+    self.use_snapshot = use_snapshot
+    
+    # Reuse one pooled keep-alive session for every Notion API call
+    self.session = requests.Session()
+    self.session.headers.update(self.headers)
+    # Back off on throttling/server errors, honouring Notion's Retry-After
+    retries = Retry(
+        total=self._MAX_RETRIES,
+        backoff_factor=0.25,
+        status_forcelist=self._RETRY_STATUSES,
+        allowed_methods=["GET", "POST", "PATCH"],
+        respect_retry_after_header=True
+    )
+    self.session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    )
+    
+    # Separate session for page creation, retrying only on 429 and connect errors
+    self.create_session = requests.Session()
+    self.create_session.headers.update(self.headers)
+    create_retries = Retry(
+        total=self._MAX_RETRIES,
+        read=0,
+        backoff_factor=0.25,
+        status_forcelist=self._CREATE_RETRY_STATUSES,
+        allowed_methods=["POST"],
+        respect_retry_after_header=True
+    )
+    self.create_session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=1, pool_maxsize=20, max_retries=create_retries)
+    )
+
+def close(self):
+    """
+    Close the underlying HTTP sessions and the local sync state store
+    """
+    self.session.close()
+    self.create_session.close()
+    self.sync_state.close()
+
+def __enter__(self):
+    return self
+
+def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
 
 def create_page(self, data: Dict) -> Dict:
     """
@@ -66,19 +255,22 @@ def create_page(self, data: Dict) -> Dict:
     properties = self._format_properties(data)
     
     payload = {
-        "parent": {"database_id": self.database_id},
+        "parent": self._parent,
         "properties": properties
     }
     
     try:
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self.create_session.post(url, data=orjson.dumps(payload))
         response.raise_for_status()
-        logger.info(f"Successfully created page for UID: {data.get('uid')}")
-        return response.json()
+        logger.debug("Successfully created page for UID: %s", data.get("uid"))
+        page = orjson.loads(response.content)
+        if data.get("uid"):
+            self._uid_cache[data["uid"]] = page["id"]
+        return page
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error creating page: {e}")
+        logger.error("Error creating page: %s", e)
         if hasattr(e.response, 'json'):
-            logger.error(f"Response: {e.response.json()}")
+            logger.error("Response: %s", e.response.json())
         raise
 
 def _format_properties(self, data: Dict) -> Dict:
@@ -91,45 +283,15 @@ def _format_properties(self, data: Dict) -> Dict:
     Returns:
         Formatted properties for Notion API
     """
-    properties = {}
-    
-    # Map your data fields to Notion properties
-    property_mapping = {
-        "Name": ("name", "title"),
-        "UID": ("uid", "rich_text"),
-        "Status": ("status", "select"),
-        "Reviewer Name": ("reviewer_name", "rich_text"),
-        "Review Date": ("review_date", "date"),
-        "Next Follow Up": ("next_follow_up", "date"),
-        "Date Added": ("date_added", "date"),
-        "Platform": ("platform", "select"),
-        "Socials": ("socials", "rich_text")
+    formatters = self._FORMATTERS
+    get = data.get
+    
+    # Empty dates are skipped rather than sent as blank strings
+    return {
+        notion_prop: formatters[prop_type](value)
+        for notion_prop, data_key, prop_type in self._PROPERTY_MAPPING
+        if (value := get(data_key)) is not None and (value or prop_type != "date")
     }
-    
-    for notion_prop, (data_key, prop_type) in property_mapping.items():
-        value = data.get(data_key)
-        
-        if value is None:
-            continue
-        
-        if prop_type == "title":
-            properties[notion_prop] = {
-                "title": [{"text": {"content": str(value)}}]
-            }
-        elif prop_type == "rich_text":
-            properties[notion_prop] = {
-                "rich_text": [{"text": {"content": str(value)}}]
-            }
-        elif prop_type == "select":
-            properties[notion_prop] = {
-                "select": {"name": str(value)}
-            }
-        elif prop_type == "date" and value:
-            properties[notion_prop] = {
-                "date": {"start": str(value)}
-            }
-    
-    return properties
 
 def check_if_exists(self, uid: str) -> Optional[str]:
     """
@@ -141,6 +303,11 @@ def check_if_exists(self, uid: str) -> Optional[str]:
     Returns:
         Page ID if exists, None otherwise
     """
+    if uid in self._uid_cache:
+        return self._uid_cache[uid]
+    if self._index_complete:
+        return None
+    
     url = f"{self.base_url}/databases/{self.database_id}/query"
     
     filter_data = {
@@ -153,17 +320,128 @@ def check_if_exists(self, uid: str) -> Optional[str]:
     }
     
     try:
-        response = requests.post(url, headers=self.headers, json=filter_data)
+        response = self.session.post(url, data=orjson.dumps(filter_data))
         response.raise_for_status()
         
-        results = response.json().get("results", [])
-        if results:
-            return results[0]["id"]
+        results = orjson.loads(response.content).get("results", [])
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error checking existence: {e}")
+        logger.error("Error checking existence: %s", e)
         raise
     
-    return None
+    page_id = results[0]["id"] if results else None
+    self._uid_cache[uid] = page_id
+    return page_id
+
+def _query_uid_pages(self, query: Dict):
+    """
+    Page through a database query, caching the UID -> page ID of each result
+    
+    Args:
+        query: Query body; start_cursor is filled in while paging
+    """
+    url = f"{self.base_url}/databases/{self.database_id}/query"
+    uid_cache = self._uid_cache
+    
+    while True:
+        try:
+            response = self.session.post(url, data=orjson.dumps(query))
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error("Error checking existence: %s", e)
+            raise
+        
+        body = orjson.loads(response.content)
+        for page in body.get("results", []):
+            rich_text = page["properties"]["UID"]["rich_text"]
+            if rich_text:
+                uid_cache[rich_text[0]["plain_text"]] = page["id"]
+        
+        if not body.get("has_more"):
+            break
+        query["start_cursor"] = body["next_cursor"]
+
+def snapshot_index(self) -> Dict[str, str]:
+    """
+    Load the UID -> page ID index of the entire database
+    
+    Costs one request per 100 rows in Notion, after which every UID lookup
+    in this run is answered locally.
+    
+    Returns:
+        Mapping of UID to page ID for every page in the database
+    """
+    self._query_uid_pages({"page_size": 100})
+    self._index_complete = True
+    
+    return {uid: page_id for uid, page_id in self._uid_cache.items() if page_id}
+
+def fetch_existing_uids(self, uids: List[str]) -> Dict[str, str]:
+    """
+    Look up many UIDs at once using compound "or" filter queries
+    
+    When use_snapshot is set, the first lookup loads the full index via
+    snapshot_index() instead.
+    
+    Args:
+        uids: The UIDs to check
+    
+    Returns:
+        Mapping of UID to page ID for every UID that already exists
+    """
+    uid_cache = self._uid_cache
+    
+    # Only query UIDs not already resolved earlier in this run
+    pending = [] if self._index_complete else [uid for uid in uids if uid not in uid_cache]
+    
+    if pending and self.use_snapshot:
+        self.snapshot_index()
+    else:
+        # Notion caps compound filters at 100 conditions per query
+        for i in range(0, len(pending), 100):
+            self._query_uid_pages({
+                "filter": {
+                    "or": [
+                        {"property": "UID", "rich_text": {"equals": uid}}
+                        for uid in pending[i:i + 100]
+                    ]
+                },
+                "page_size": 100
+            })
+    
+    for uid in uids:
+        uid_cache.setdefault(uid, None)
+    
+    return {uid: uid_cache[uid] for uid in uids if uid_cache[uid]}
+
+def _content_hash(self, data: Dict) -> str:
+    """
+    Stable hash over the fields an update would send for this record
+    
+    Args:
+        data: Raw data dictionary
+    
+    Returns:
+        Hex digest identifying the record's current content
+    """
+    content = {field: data.get(field) for field in self._UPDATE_FIELDS}
+    return hashlib.blake2b(
+        orjson.dumps(content, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16
+    ).hexdigest()
+
+def _format_update_properties(self, data: Dict) -> Dict:
+    """
+    Format only the fields that may change after a page is created
+    
+    Args:
+        data: Raw data dictionary
+    
+    Returns:
+        Formatted properties for Notion API
+    """
+    return self._format_properties(
+        {field: data[field] for field in self._UPDATE_FIELDS if field in data}
+    )
 
 def update_page(self, page_id: str, data: Dict) -> Dict:
     """
@@ -178,33 +456,23 @@ def update_page(self, page_id: str, data: Dict) -> Dict:
     """
     url = f"{self.base_url}/pages/{page_id}"
     
-    # Only update specific fields that might change
-    update_fields = ["status", "platform", "socials", "reviewer_name", 
-                    "review_date", "next_follow_up"]
-    
-    properties = {}
-    for field in update_fields:
-        if field in data:
-            formatted = self._format_properties({field: data[field]})
-            properties.update(formatted)
-    
-    payload = {"properties": properties}
+    payload = {"properties": self._format_update_properties(data)}
     
     try:
-        response = requests.patch(url, headers=self.headers, json=payload)
+        response = self.session.patch(url, data=orjson.dumps(payload))
         response.raise_for_status()
-        logger.info(f"Successfully updated page: {page_id}")
-        return response.json()
+        logger.debug("Successfully updated page: %s", page_id)
+        return orjson.loads(response.content)
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error updating page: {e}")
+        logger.error("Error updating page: %s", e)
         raise
 
-def sync_from_database(self, records: List[Dict]) -> Dict:
+def sync_from_database(self, records: Iterable[Dict]) -> Dict:
     """
     Sync multiple records from your internal database to Notion
     
     Args:
-        records: List of dictionaries containing record data
+        records: Iterable of dictionaries containing record data, consumed lazily
     
     Returns:
         Summary of sync operations
@@ -212,47 +480,381 @@ def sync_from_database(self, records: List[Dict]) -> Dict:
     summary = {
         "created": 0,
         "updated": 0,
+        "skipped": 0,
         "errors": 0,
-        "error_details": []
+        # Only the most recent errors are kept, so memory stays flat on bad batches
+        "error_details": deque(maxlen=5),
+        "synced_uids": []
     }
-    
-    for record in records:
+    processed = 0
+    # Whether the latest copy of each UID reached Notion, in record order
+    last_outcome = {}
+    
+    for batch in _batched(records, self._LOOKUP_BATCH_SIZE):
+        hashes = [self._content_hash(record) if record.get("uid") else None for record in batch]
+        stored_hashes = self.sync_state.get_hashes(
+            [record["uid"] for record in batch if record.get("uid")]
+        )
+        
+        # Resolve the changed records against Notion instead of once per record.
+        # A failed lookup fails only the records that needed it
+        lookup_error = None
         try:
-            uid = record.get("uid")
-            
-            if not uid:
-                logger.warning(f"Skipping record without UID: {record}")
+            existing = self.fetch_existing_uids(list(dict.fromkeys(
+                record["uid"] for record, content_hash in zip(batch, hashes)
+                if content_hash and stored_hashes.get(record["uid"]) != content_hash
+            )))
+        except Exception as e:
+            logger.error("Error looking up UIDs in Notion: %s", e)
+            existing = {}
+            lookup_error = e
+        
+        synced_hashes = {}
+        for record, content_hash in zip(batch, hashes):
+            try:
+                uid = record.get("uid")
+                
+                if not uid:
+                    logger.warning("Skipping record without UID: %s", record)
+                    summary["errors"] += 1
+                    summary["error_details"].append({
+                        "uid": record.get("uid"),
+                        "error": "Missing UID"
+                    })
+                    continue
+                
+                # Unchanged since the last version that reached Notion, either
+                # in an earlier run or from a duplicate earlier in this batch
+                if synced_hashes.get(uid, stored_hashes.get(uid)) == content_hash:
+                    summary["skipped"] += 1
+                    last_outcome[uid] = True
+                    continue
+                
+                if lookup_error is not None:
+                    last_outcome[uid] = False
+                    summary["errors"] += 1
+                    summary["error_details"].append({
+                        "uid": uid,
+                        "error": str(lookup_error)
+                    })
+                    continue
+                
+                # Check if record exists
+                existing_page_id = existing.get(uid)
+                
+                if existing_page_id:
+                    # Update existing record
+                    logger.debug("Updating existing record: %s", uid)
+                    self.update_page(existing_page_id, record)
+                    summary["updated"] += 1
+                else:
+                    # Create new record
+                    logger.debug("Creating new record: %s", uid)
+                    page = self.create_page(record)
+                    existing[uid] = page["id"]
+                    summary["created"] += 1
+                
+                synced_hashes[uid] = content_hash
+                last_outcome[uid] = True
+                    
+            except Exception as e:
+                logger.error("Error processing record %s: %s", record.get("uid", "unknown"), e)
+                if record.get("uid"):
+                    last_outcome[record["uid"]] = False
                 summary["errors"] += 1
                 summary["error_details"].append({
-                    "record": record,
-                    "error": "Missing UID"
+                    "uid": record.get("uid"),
+                    "error": str(e)
                 })
-                continue
-            
-            # Check if record exists
-            existing_page_id = self.check_if_exists(uid)
+        
+        self.sync_state.set_hashes(synced_hashes)
+        
+        processed += len(batch)
+        logger.info("Progress: %d records processed", processed)
+    
+    # Only UIDs whose newest copy made it are safe to flag as synced
+    summary["synced_uids"] = [uid for uid, ok in last_outcome.items() if ok]
+    
+    logger.info("Sync Summary: Created: %d, Updated: %d, Skipped: %d, Errors: %d",
+                summary["created"], summary["updated"], summary["skipped"], summary["errors"])
+    
+    return summary
+
+async def _request_async(self, session, sem, limiter, method: str, url: str,
+                         payload: Dict, retry_statuses: Tuple[int, ...] = None) -> Dict:
+    """
+    Send one Notion API request over aiohttp, retrying when throttled
+    
+    429 responses wait for the Retry-After header; other retryable statuses
+    and connection failures back off exponentially. Gives up after
+    _MAX_RETRIES retries.
+    
+    Args:
+        session: Shared aiohttp client session
+        sem: Semaphore bounding in-flight requests
+        limiter: Rate limiter shared by all requests
+        method: HTTP method
+        url: Request URL
+        payload: JSON body
+        retry_statuses: Statuses worth retrying (defaults to _RETRY_STATUSES)
+    
+    Returns:
+        Parsed response body
+    """
+    import aiohttp
+    
+    body = orjson.dumps(payload)
+    retry_statuses = retry_statuses or self._RETRY_STATUSES
+    
+    for attempt in range(self._MAX_RETRIES + 1):
+        try:
+            async with sem, limiter:
+                async with session.request(method, url, data=body) as response:
+                    if response.status not in retry_statuses or attempt == self._MAX_RETRIES:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+                    
+                    reason = response.status
+                    if response.status == 429:
+                        delay = float(response.headers.get("Retry-After", 1))
+                    else:
+                        delay = 0.25 * (2 ** attempt)
+        except aiohttp.ClientConnectorError as e:
+            # The request never reached Notion, so retrying is always safe
+            if attempt == self._MAX_RETRIES:
+                raise
+            reason = e
+            delay = 0.25 * (2 ** attempt)
+        
+        # Sleep outside the semaphore so other requests keep flowing
+        logger.warning("Notion request failed (%s), retrying in %ss", reason, delay)
+        await asyncio.sleep(delay)
+
+async def _create_page_async(self, session, sem, limiter, data: Dict) -> Dict:
+    """
+    Create a new page (row) in the Notion database over aiohttp
+    
+    Args:
+        session: Shared aiohttp client session
+        sem: Semaphore bounding in-flight requests
+        limiter: Rate limiter shared by all requests
+        data: Dictionary containing the row data
+    
+    Returns:
+        Response from Notion API
+    """
+    url = f"{self.base_url}/pages"
+    
+    payload = {
+        "parent": self._parent,
+        "properties": self._format_properties(data)
+    }
+    
+    try:
+        page = await self._request_async(
+            session, sem, limiter, "POST", url, payload,
+            retry_statuses=self._CREATE_RETRY_STATUSES
+        )
+    except Exception as e:
+        logger.error("Error creating page: %s", e)
+        raise
+    
+    logger.debug("Successfully created page for UID: %s", data.get("uid"))
+    if data.get("uid"):
+        self._uid_cache[data["uid"]] = page["id"]
+    return page
+
+async def _update_page_async(self, session, sem, limiter, page_id: str, data: Dict) -> Dict:
+    """
+    Update an existing page in Notion over aiohttp
+    
+    Args:
+        session: Shared aiohttp client session
+        sem: Semaphore bounding in-flight requests
+        limiter: Rate limiter shared by all requests
+        page_id: The ID of the page to update
+        data: Dictionary containing the updated data
+    
+    Returns:
+        Response from Notion API
+    """
+    url = f"{self.base_url}/pages/{page_id}"
+    
+    payload = {"properties": self._format_update_properties(data)}
+    
+    try:
+        page = await self._request_async(session, sem, limiter, "PATCH", url, payload)
+    except Exception as e:
+        logger.error("Error updating page: %s", e)
+        raise
+    
+    logger.debug("Successfully updated page: %s", page_id)
+    return page
+
+async def _sync_uid_async(self, session, sem, limiter, existing: Dict[str, str],
+                          uid: str, records: List[Dict], hashes: Dict[int, str],
+                          synced_hash: Optional[str]) -> List[tuple]:
+    """
+    Sync every record sharing one UID, in order
+    
+    Records with the same UID are handled sequentially so the first one
+    creates the page and the rest update it. A record is skipped only when
+    its content matches the last version that reached Notion.
+    
+    Returns:
+        List of (record, action, error) tuples
+    """
+    outcomes = []
+    
+    for record in records:
+        content_hash = hashes[id(record)]
+        if content_hash == synced_hash:
+            outcomes.append((record, "skipped", None))
+            continue
+        
+        try:
+            existing_page_id = existing.get(uid)
             
             if existing_page_id:
-                # Update existing record
-                logger.info(f"Updating existing record: {uid}")
-                self.update_page(existing_page_id, record)
-                summary["updated"] += 1
+                logger.debug("Updating existing record: %s", uid)
+                await self._update_page_async(session, sem, limiter, existing_page_id, record)
+                outcomes.append((record, "updated", None))
             else:
-                # Create new record
-                logger.info(f"Creating new record: {uid}")
-                self.create_page(record)
-                summary["created"] += 1
-                
+                logger.debug("Creating new record: %s", uid)
+                page = await self._create_page_async(session, sem, limiter, record)
+                existing[uid] = page["id"]
+                outcomes.append((record, "created", None))
+            synced_hash = content_hash
         except Exception as e:
-            logger.error(f"Error processing record {record.get('uid', 'unknown')}: {str(e)}")
-            summary["errors"] += 1
-            summary["error_details"].append({
-                "record": record,
-                "error": str(e)
-            })
+            logger.error("Error processing record %s: %s", uid, e)
+            outcomes.append((record, None, e))
     
-    logger.info(f"Sync Summary: Created: {summary['created']}, "
-               f"Updated: {summary['updated']}, Errors: {summary['errors']}")
+    return outcomes
+
+async def async_sync_from_database(self, records: Iterable[Dict], concurrency: int = 8,
+                                   requests_per_second: float = 3) -> Dict:
+    """
+    Sync multiple records to Notion with concurrent create/update calls
+    
+    Falls back to sync_from_database when aiohttp is not installed.
+    
+    Args:
+        records: Iterable of dictionaries containing record data, consumed lazily
+        concurrency: Maximum number of in-flight requests
+        requests_per_second: Request rate cap (Notion allows ~3 req/s)
+    
+    Returns:
+        Summary of sync operations
+    """
+    try:
+        import aiohttp
+        from aiolimiter import AsyncLimiter
+    except ImportError:
+        logger.warning("aiohttp/aiolimiter not installed, falling back to serial sync. "
+                       "Run: pip install aiohttp aiolimiter")
+        return self.sync_from_database(records)
+    
+    summary = {
+        "created": 0,
+        "updated": 0,
+        "skipped": 0,
+        "errors": 0,
+        # Only the most recent errors are kept, so memory stays flat on bad batches
+        "error_details": deque(maxlen=5),
+        "synced_uids": []
+    }
+    processed = 0
+    # Whether the latest copy of each UID reached Notion, in record order
+    last_outcome = {}
+    
+    sem = asyncio.Semaphore(concurrency)
+    limiter = AsyncLimiter(requests_per_second, 1)
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+    
+    async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+        for batch in _batched(records, self._LOOKUP_BATCH_SIZE):
+            stored_hashes = self.sync_state.get_hashes(
+                [record["uid"] for record in batch if record.get("uid")]
+            )
+            
+            # Group records by UID so duplicates never race to create the same page
+            grouped = {}
+            hashes = {}
+            for record in batch:
+                uid = record.get("uid")
+                
+                if not uid:
+                    logger.warning("Skipping record without UID: %s", record)
+                    summary["errors"] += 1
+                    summary["error_details"].append({
+                        "uid": record.get("uid"),
+                        "error": "Missing UID"
+                    })
+                    continue
+                
+                # Unchanged since the last successful sync, nothing to push.
+                # Later duplicates join their group, which decides once the
+                # earlier copies have actually reached Notion
+                content_hash = self._content_hash(record)
+                if uid not in grouped and stored_hashes.get(uid) == content_hash:
+                    summary["skipped"] += 1
+                    last_outcome[uid] = True
+                    continue
+                
+                grouped.setdefault(uid, []).append(record)
+                hashes[id(record)] = content_hash
+            
+            try:
+                existing = self.fetch_existing_uids(list(grouped))
+            except Exception as e:
+                # Fail only the records this lookup was for, not the whole run
+                logger.error("Error looking up UIDs in Notion: %s", e)
+                for uid, uid_records in grouped.items():
+                    last_outcome[uid] = False
+                    for record in uid_records:
+                        summary["errors"] += 1
+                        summary["error_details"].append({
+                            "uid": record.get("uid"),
+                            "error": str(e)
+                        })
+                processed += len(batch)
+                logger.info("Progress: %d records processed", processed)
+                continue
+            
+            coros = [
+                self._sync_uid_async(session, sem, limiter, existing, uid, uid_records,
+                                     hashes, stored_hashes.get(uid))
+                for uid, uid_records in grouped.items()
+            ]
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            
+            synced_hashes = {}
+            for (uid, uid_records), result in zip(grouped.items(), results):
+                if isinstance(result, BaseException):
+                    result = [(record, None, result) for record in uid_records]
+                
+                for record, action, error in result:
+                    last_outcome[uid] = error is None
+                    if error is None:
+                        summary[action] += 1
+                        synced_hashes[uid] = hashes[id(record)]
+                    else:
+                        summary["errors"] += 1
+                        summary["error_details"].append({
+                            "uid": record.get("uid"),
+                            "error": str(error)
+                        })
+            
+            self.sync_state.set_hashes(synced_hashes)
+            
+            processed += len(batch)
+            logger.info("Progress: %d records processed", processed)
+    
+    # Only UIDs whose newest copy made it are safe to flag as synced
+    summary["synced_uids"] = [uid for uid, ok in last_outcome.items() if ok]
+    
+    logger.info("Sync Summary: Created: %d, Updated: %d, Skipped: %d, Errors: %d",
+                summary["created"], summary["updated"], summary["skipped"], summary["errors"])
     
     return summary
 ```
@@ -290,157 +892,306 @@ def get_connector(db_type: str = None):
     
     return connector_class()
 
-def fetch_records(self) -> List[Dict]:
+def fetch_records(self) -> Iterable[Dict]:
     """
     Fetch records from the database
-    Must be implemented by subclasses
+    Must be implemented by subclasses; may return a lazy iterator
     """
     raise NotImplementedError("Subclasses must implement fetch_records")
+
+def mark_synced(self, uids: List[str]):
+    """
+    Flag records as synced so later runs stop fetching them
+    Connectors without write-back support leave the records untouched
+    
+    Args:
+        uids: UIDs of records now reflected in Notion
+    """
+    logger.info("%s does not support marking records as synced", type(self).__name__)
 ```
 
 class PostgreSQLConnector(DatabaseConnector):
 “”“PostgreSQL database connector”””
 
 ```
-def fetch_records(self) -> List[Dict]:
+# Connection pool shared by every instance, created on first use
+_pool = None
+
+@classmethod
+def _get_pool(cls):
+    from psycopg.rows import dict_row
+    from psycopg_pool import ConnectionPool
+    
+    if cls._pool is None:
+        config = _get_db_config()
+        cls._pool = ConnectionPool(
+            kwargs={
+                "host": config["host"],
+                "dbname": config["name"],
+                "user": config["user"],
+                "password": config["password"],
+                "port": config["port"] or 5432,
+                "row_factory": dict_row
+            },
+            min_size=1,
+            max_size=4,
+            open=True
+        )
+    
+    return cls._pool
+
+def fetch_records(self) -> Iterator[Dict]:
     try:
-        import psycopg2
-        import psycopg2.extras
+        pool = self._get_pool()
     except ImportError:
-        logger.error("psycopg2 not installed. Run: pip install psycopg2-binary")
+        logger.error("psycopg not installed. Run: pip install 'psycopg[binary,pool]'")
         return []
     
-    conn = psycopg2.connect(
-        host=os.getenv("DB_HOST"),
-        database=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        port=os.getenv("DB_PORT", 5432)
-    )
-    
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-    
-    query = os.getenv("DB_QUERY", """
-        SELECT 
-            uid, name, status, reviewer_name, 
-            review_date, next_follow_up, date_added, 
-            platform, socials
-        FROM fud_outreach_tracker
-        WHERE sync_status IS NULL OR sync_status != 'synced'
-        ORDER BY date_added DESC
-    """)
-    
-    cursor.execute(query)
-    records = [dict(row) for row in cursor.fetchall()]
-    
-    cursor.close()
-    conn.close()
+    with pool.connection() as conn:
+        # Named cursor = server-side cursor, rows are streamed in itersize chunks
+        # using the binary protocol so values skip text parsing
+        cursor = conn.cursor(name="sync_cur", binary=True)
+        cursor.itersize = 1000
+        
+        try:
+            cursor.execute(_get_db_config()["query"])
+            yield from cursor
+        finally:
+            cursor.close()
+
+def mark_synced(self, uids: List[str]):
+    if not uids:
+        return
     
-    return records
+    # Single statement in a single transaction, committed when the block exits
+    with self._get_pool().connection() as conn:
+        conn.execute(
+            f"UPDATE {_get_db_config()['table']} SET sync_status = 'synced' WHERE uid = ANY(%s)",
+            (uids,)
+        )
 ```
 
 class MySQLConnector(DatabaseConnector):
 “”“MySQL database connector”””
 
 ```
-def fetch_records(self) -> List[Dict]:
+# Connection pool shared by every instance, created on first use
+_pool = None
+
+@classmethod
+def _get_pool(cls):
+    import mysql.connector.pooling
+    
+    if cls._pool is None:
+        config = _get_db_config()
+        cls._pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="notion_sync",
+            pool_size=4,
+            host=config["host"],
+            database=config["name"],
+            user=config["user"],
+            password=config["password"],
+            port=config["port"] or 3306,
+            use_pure=False
+        )
+    
+    return cls._pool
+
+def fetch_records(self) -> Iterator[Dict]:
     try:
-        import mysql.connector
+        pool = self._get_pool()
     except ImportError:
         logger.error("mysql-connector-python not installed. Run: pip install mysql-connector-python")
         return []
     
-    conn = mysql.connector.connect(
-        host=os.getenv("DB_HOST"),
-        database=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        port=os.getenv("DB_PORT", 3306)
-    )
+    # Closing a pooled connection hands it back to the pool
+    conn = pool.get_connection()
     
-    cursor = conn.cursor(dictionary=True)
-    
-    query = os.getenv("DB_QUERY", """
-        SELECT 
-            uid, name, status, reviewer_name, 
-            review_date, next_follow_up, date_added, 
-            platform, socials
-        FROM fud_outreach_tracker
-        WHERE sync_status IS NULL OR sync_status != 'synced'
-        ORDER BY date_added DESC
-    """)
+    # Unbuffered cursor streams rows from the server instead of loading them all
+    cursor = conn.cursor(dictionary=True, buffered=False)
     
-    cursor.execute(query)
-    records = cursor.fetchall()
+    try:
+        cursor.execute(_get_db_config()["query"])
+        for row in cursor:
+            yield row
+    finally:
+        cursor.close()
+        conn.close()
+
+def mark_synced(self, uids: List[str]):
+    if not uids:
+        return
     
-    cursor.close()
-    conn.close()
+    conn = self._get_pool().get_connection()
+    cursor = conn.cursor()
     
-    return records
+    try:
+        cursor.executemany(
+            f"UPDATE {_get_db_config()['table']} SET sync_status = 'synced' WHERE uid = %s",
+            [(uid,) for uid in uids]
+        )
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
 ```
 
 class MongoDBConnector(DatabaseConnector):
 “”“MongoDB database connector”””
 
 ```
-def fetch_records(self) -> List[Dict]:
+# MongoClient pools connections internally, so one client is reused
+_client = None
+
+@classmethod
+def _get_collection(cls):
+    from pymongo import MongoClient
+    
+    config = _get_db_config()
+    
+    if cls._client is None:
+        connection_string = config["mongo_connection_string"] or \
+            f"mongodb://{config['user']}:{config['password']}@{config['host']}:{config['port'] or 27017}/{config['name']}"
+        cls._client = MongoClient(connection_string)
+    
+    db = cls._client[config["name"]]
+    return db[config["collection"]]
+
+# Only the fields the sync uses are sent back by the server
+_PROJECTION = {
+    "_id": 1, "uid": 1, "name": 1, "status": 1, "reviewer_name": 1,
+    "review_date": 1, "next_follow_up": 1, "date_added": 1,
+    "platform": 1, "socials": 1
+}
+
+def fetch_records(self) -> Iterator[Dict]:
     try:
-        from pymongo import MongoClient
+        collection = self._get_collection()
     except ImportError:
         logger.error("pymongo not installed. Run: pip install pymongo")
         return []
     
-    connection_string = os.getenv("MONGO_CONNECTION_STRING") or \
-        f"mongodb://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT', 27017)}/{os.getenv('DB_NAME')}"
-    
-    client = MongoClient(connection_string)
-    db = client[os.getenv("DB_NAME")]
-    collection = db[os.getenv("DB_COLLECTION", "fud_outreach_tracker")]
-    
-    # Find documents that haven't been synced
+    # Find documents that haven't been synced, streamed in server-side batches
     query = {"sync_status": {"$ne": "synced"}}
-    records = list(collection.find(query))
-    
-    # Convert ObjectId to string if present
-    for record in records:
-        if "_id" in record:
-            record["_id"] = str(record["_id"])
+    cursor = collection.find(query, projection=self._PROJECTION, batch_size=1000)
     
-    client.close()
+    try:
+        for record in cursor:
+            # Convert ObjectId to string if present
+            if (oid := record.get("_id")) is not None:
+                record["_id"] = str(oid)
+            yield record
+    finally:
+        cursor.close()
+
+def mark_synced(self, uids: List[str]):
+    if not uids:
+        return
     
-    return records
+    self._get_collection().update_many(
+        {"uid": {"$in": uids}},
+        {"$set": {"sync_status": "synced"}}
+    )
 ```
 
 class SQLiteConnector(DatabaseConnector):
 “”“SQLite database connector”””
 
 ```
-def fetch_records(self) -> List[Dict]:
-    import sqlite3
-    
-    db_path = os.getenv("SQLITE_DB_PATH", "database.db")
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+def fetch_records(self) -> Iterator[Dict]:
+    config = _get_db_config()
+    conn = sqlite3.connect(config["sqlite_path"])
     
     cursor = conn.cursor()
     
-    query = os.getenv("DB_QUERY", """
-        SELECT 
-            uid, name, status, reviewer_name, 
-            review_date, next_follow_up, date_added, 
-            platform, socials
-        FROM fud_outreach_tracker
-        WHERE sync_status IS NULL OR sync_status != 'synced'
-        ORDER BY date_added DESC
+    try:
+        cursor.execute(config["query"])
+        # Bind column names once and zip plain tuples, instead of building
+        # a sqlite3.Row per row and converting it key by key
+        columns = [column[0] for column in cursor.description]
+        for row in cursor:
+            yield dict(zip(columns, row))
+    finally:
+        cursor.close()
+        conn.close()
+
+def mark_synced(self, uids: List[str]):
+    if not uids:
+        return
+    
+    config = _get_db_config()
+    conn = sqlite3.connect(config["sqlite_path"])
+    
+    try:
+        # The connection context manager wraps the updates in one transaction
+        with conn:
+            conn.executemany(
+                f"UPDATE {config['table']} SET sync_status = 'synced' WHERE uid = ?",
+                [(uid,) for uid in uids]
+            )
+    finally:
+        conn.close()
+```
+
+class SyncStateStore:
+“””
+Local SQLite store of content hashes for records already synced to Notion
+Hashes are scoped to one Notion database, so the same file can serve several
+“””
+
+```
+def __init__(self, path: str, database_id: str):
+    self.database_id = database_id
+    self.conn = sqlite3.connect(path)
+    self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS sync_state (
+            database_id TEXT NOT NULL,
+            uid TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            PRIMARY KEY (database_id, uid)
+        )
     """)
+    self.conn.commit()
+
+def get_hashes(self, uids: List[str]) -> Dict[str, str]:
+    """
+    Fetch stored content hashes for the given UIDs
     
-    cursor.execute(query)
-    records = [dict(row) for row in cursor.fetchall()]
+    Args:
+        uids: UIDs to look up
     
-    cursor.close()
-    conn.close()
+    Returns:
+        Mapping of UID to stored hash for UIDs seen before
+    """
+    if not uids:
+        return {}
+    
+    placeholders = ",".join("?" * len(uids))
+    cursor = self.conn.execute(
+        "SELECT uid, content_hash FROM sync_state "
+        f"WHERE database_id = ? AND uid IN ({placeholders})",
+        [self.database_id, *uids]
+    )
+    return dict(cursor.fetchall())
+
+def set_hashes(self, hashes: Dict[str, str]):
+    """
+    Record content hashes after a successful create/update
     
-    return records
+    Args:
+        hashes: Mapping of UID to content hash
+    """
+    if not hashes:
+        return
+    
+    self.conn.executemany(
+        "INSERT OR REPLACE INTO sync_state (database_id, uid, content_hash) VALUES (?, ?, ?)",
+        [(self.database_id, uid, content_hash) for uid, content_hash in hashes.items()]
+    )
+    self.conn.commit()
+
+def close(self):
+    self.conn.close()
 ```
 
 def main():
@@ -455,42 +1206,56 @@ sync_client = NotionDatabaseSync()
 ```
     # Get the appropriate database connector
     db_type = os.getenv("DB_TYPE", "postgresql")
-    logger.info(f"Connecting to {db_type} database...")
+    logger.info("Connecting to %s database...", db_type)
     
     connector = DatabaseConnector.get_connector(db_type)
     
-    # Fetch data from your internal database
+    # Fetch data from your internal database; records are streamed into the sync
     logger.info("Fetching data from internal database...")
     records = connector.fetch_records()
-    logger.info(f"Found {len(records)} records to sync")
-    
-    if not records:
-        logger.info("No records to sync")
-        return
     
     # Sync to Notion
     logger.info("Syncing to Notion...")
-    summary = sync_client.sync_from_database(records)
+    with sync_client:
+        summary = asyncio.run(sync_client.async_sync_from_database(records))
+    
+    if not (summary['created'] or summary['updated'] or summary['skipped'] or summary['errors']):
+        logger.info("No records to sync")
+        return
     
-    # Print summary
+    # Print summary once pending log lines are out, so the two don't interleave
+    _flush_logs()
     print("\n" + "="*50)
     print("SYNC COMPLETE")
     print("="*50)
     print(f"✅ Created: {summary['created']} new records")
     print(f"📝 Updated: {summary['updated']} existing records")
+    print(f"⏭️ Skipped: {summary['skipped']} unchanged records")
     print(f"❌ Errors: {summary['errors']} failed records")
     
     if summary['error_details']:
         print("\nError Details:")
-        for error in summary['error_details'][:5]:  # Show first 5 errors
-            print(f"  - UID {error['record'].get('uid', 'unknown')}: {error['error']}")
+        for error in summary['error_details']:  # Last 5 errors
+            print(f"  - UID {error['uid'] or 'unknown'}: {error['error']}")
+    sys.stdout.flush()
+    
+    # Flag everything now reflected in Notion so the next run skips it. The
+    # sync itself already succeeded, so a failure here is only a warning
+    if summary['synced_uids'] and _get_db_config()["mark_synced"]:
+        logger.info("Marking synced records in internal database...")
+        try:
+            connector.mark_synced(summary['synced_uids'])
+        except Exception as e:
+            logger.warning("Could not mark records as synced: %s", e)
+    elif summary['synced_uids']:
+        logger.info("DB_QUERY is set without DB_TABLE, not marking records as synced")
     
     # Exit with error code if there were errors
     if summary['errors'] > 0:
         sys.exit(1)
         
 except Exception as e:
-    logger.error(f"Fatal error: {e}")
+    logger.error("Fatal error: %s", e)
     sys.exit(1)
 ```
 